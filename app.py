@@ -4,30 +4,90 @@ Simple Flask web application.
 Provides /api/ping endpoint that returns JSON with message and hostname.
 """
 
+import json
 import logging
 import os
 import socket
 
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Keep werkzeug's per-request access log out of the hot path in production
+logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C-level serializer."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 logger = logging.getLogger(__name__)
 
+# Route jsonify() through orjson when available so any dynamic payloads
+# (error handlers, future endpoints) serialize at C speed
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 
-def get_hostname():
+def _get_hostname():
     """Get the hostname of the current server node."""
     try:
         return socket.gethostname()
     except Exception as e:
-        logger.error(f"Error getting hostname: {e}")
+        logger.error("Error getting hostname: %s", e)
         return "unknown"
 
 
+# Resolved once at import: the hostname never changes for the lifetime of the
+# process, so the hot endpoints should not pay a syscall on every request.
+HOSTNAME = _get_hostname()
+
+# With the hostname fixed per process, the response payloads are constants.
+# Serialize them once at import so the handlers skip dict construction and
+# json.dumps on every request.
+HOME_BODY = json.dumps(
+    {
+        "message": "I hope to be part of the Alcatraz AI DevOps team soon :)",
+        "hostname": HOSTNAME,
+        "status": "ready",
+    }
+).encode()
+PING_BODY = json.dumps({"message": "pong", "hostname": HOSTNAME}).encode()
+HEALTH_BODY = b'{"status": "healthy"}'
+
+
+def _static_json_response(body):
+    """Build a JSON response for a fixed body with an explicit Content-Length
+    so the server emits a single sized frame instead of chunked encoding."""
+    response = Response(body, status=200, mimetype="application/json")
+    response.headers["Content-Length"] = str(len(body))
+    return response
+
+
+# Shared Response objects built once at import: returning the same instance
+# from every request also skips the per-request response construction and
+# jsonify's app-context lookup. Safe because nothing mutates them per request.
+_HOME_RESPONSE = _static_json_response(HOME_BODY)
+_PING_RESPONSE = _static_json_response(PING_BODY)
+_HEALTH_RESPONSE = _static_json_response(HEALTH_BODY)
+
+
 @app.route("/", methods=["GET"])
 def home():
     """
@@ -36,15 +96,8 @@ def home():
     Returns:
         JSON response with custom message and hostname
     """
-    hostname = get_hostname()
-    response_data = {
-        "message": "I hope to be part of the Alcatraz AI DevOps team soon :)",
-        "hostname": hostname,
-        "status": "ready",
-    }
-
-    logger.info(f"Received home request, responding from {hostname}")
-    return jsonify(response_data)
+    logger.debug("Received home request, responding from %s", HOSTNAME)
+    return _HOME_RESPONSE
 
 
 @app.route("/api/ping", methods=["GET"])
@@ -55,17 +108,14 @@ def ping():
     Returns:
         JSON response with message and hostname
     """
-    hostname = get_hostname()
-    response_data = {"message": "pong", "hostname": hostname}
-
-    logger.info(f"Received ping request, responding from {hostname}")
-    return jsonify(response_data)
+    logger.debug("Received ping request, responding from %s", HOSTNAME)
+    return _PING_RESPONSE
 
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for load balancer."""
-    return jsonify({"status": "healthy"}), 200
+    return _HEALTH_RESPONSE
 
 
 @app.errorhandler(404)
@@ -77,7 +127,7 @@ def not_found(error):
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}")
+    logger.error("Internal server error: %s", error)
     return jsonify({"error": "Internal server error"}), 500
 
 
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+ASGI variant of the ping application.
+Serves the same endpoints as app.py on FastAPI for deployments where
+uvicorn's C-accelerated event loop and HTTP parsing are preferred:
+
+    uvicorn app_asgi:app --loop uvloop --http httptools --workers 4
+
+Requires the extra dependencies in requirements-asgi.txt.
+"""
+
+from fastapi import FastAPI, Response
+
+from app import HEALTH_BODY, HOME_BODY, PING_BODY
+
+app = FastAPI()
+
+
+@app.get("/")
+async def home():
+    """Home endpoint with custom message."""
+    return Response(HOME_BODY, media_type="application/json")
+
+
+@app.get("/api/ping")
+async def ping():
+    """Ping endpoint that returns pong message with hostname."""
+    return Response(PING_BODY, media_type="application/json")
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint for load balancer."""
+    return Response(HEALTH_BODY, media_type="application/json")
@@ -15,6 +15,11 @@ http {
     access_log /var/log/nginx/access.log main;
     error_log /var/log/nginx/error.log;
 
+    # Keep client connections open longer than typical think-time so
+    # repeated requests reuse the TCP/TLS connection (matches gunicorn's
+    # keepalive of 75s)
+    keepalive_timeout 75s;
+
     # Gzip compression
     gzip on;
     gzip_vary on;
@@ -34,6 +39,7 @@ http {
         %{ for node in app_nodes ~}
         server ${node.name}:5000 max_fails=3 fail_timeout=30s;
         %{ endfor ~}
+        keepalive 32;
     }
 
     # Rate limiting
@@ -63,6 +69,11 @@ http {
 
         location /api/ping {
             proxy_pass http://app_backend;
+
+            # Reuse upstream connections from the keepalive pool
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
+
             proxy_set_header Host $host;
             proxy_set_header X-Real-IP $remote_addr;
             proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
@@ -77,10 +88,36 @@ http {
             proxy_next_upstream error timeout invalid_header http_500 http_502 http_503;
         }
 
-        location /health {
+        # Answered directly by nginx so LB probes cost no backend CPU and
+        # stay responsive even when the app workers are saturated; the
+        # Flask /health route remains available for deep health checks
+        location = /health {
             access_log off;
-            return 200 "healthy\n";
-            add_header Content-Type text/plain;
+            default_type application/json;
+            return 200 '{"status": "healthy"}';
+        }
+
+        # Home endpoint, proxied with the same keepalive directives as
+        # /api/ping so upstream connections are reused on every path
+        location = / {
+            proxy_pass http://app_backend;
+
+            # Reuse upstream connections from the keepalive pool
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
+
+            proxy_set_header Host $host;
+            proxy_set_header X-Real-IP $remote_addr;
+            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+            proxy_set_header X-Forwarded-Proto $scheme;
+
+            # Timeouts
+            proxy_connect_timeout 5s;
+            proxy_send_timeout 10s;
+            proxy_read_timeout 10s;
+
+            # Health check
+            proxy_next_upstream error timeout invalid_header http_500 http_502 http_503;
         }
 
         location / {
@@ -110,6 +147,11 @@ http {
 
         location /api/ping {
             proxy_pass http://app_backend;
+
+            # Reuse upstream connections from the keepalive pool
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
+
             proxy_set_header Host $host;
             proxy_set_header X-Real-IP $remote_addr;
             proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
@@ -124,10 +166,36 @@ http {
             proxy_next_upstream error timeout invalid_header http_500 http_502 http_503;
         }
 
-        location /health {
+        # Answered directly by nginx so LB probes cost no backend CPU and
+        # stay responsive even when the app workers are saturated; the
+        # Flask /health route remains available for deep health checks
+        location = /health {
             access_log off;
-            return 200 "healthy\n";
-            add_header Content-Type text/plain;
+            default_type application/json;
+            return 200 '{"status": "healthy"}';
+        }
+
+        # Home endpoint, proxied with the same keepalive directives as
+        # /api/ping so upstream connections are reused on every path
+        location = / {
+            proxy_pass http://app_backend;
+
+            # Reuse upstream connections from the keepalive pool
+            proxy_http_version 1.1;
+            proxy_set_header Connection "";
+
+            proxy_set_header Host $host;
+            proxy_set_header X-Real-IP $remote_addr;
+            proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+            proxy_set_header X-Forwarded-Proto $scheme;
+
+            # Timeouts
+            proxy_connect_timeout 5s;
+            proxy_send_timeout 10s;
+            proxy_read_timeout 10s;
+
+            # Health check
+            proxy_next_upstream error timeout invalid_header http_500 http_502 http_503;
         }
 
         location / {
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for the Flask ping application."""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('FLASK_PORT', '5000')}"
+
+# Threaded workers sized to the node so concurrent pings do not serialize
+# through a single Python thread; GUNICORN_WORKERS overrides the auto-sizing
+# (0 or unset means size to the node)
+workers = int(os.getenv("GUNICORN_WORKERS", "0")) or (os.cpu_count() or 1) * 2 + 1
+worker_class = "gthread"
+threads = 8
+
+# Keep connections open longer than typical LB/client think-time so
+# keep-alive is actually reused between requests
+keepalive = 75
+
+timeout = 30
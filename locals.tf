@@ -36,16 +36,19 @@ locals {
     "FLASK_PORT=${var.app_port}",
     "FLASK_DEBUG=true",
     "LOG_LEVEL=${var.log_level}",
-    "APP_NAME=${var.app_name}"
+    "APP_NAME=${var.app_name}",
+    "GUNICORN_WORKERS=${var.gunicorn_workers}"
   ]
 
-  # Gunicorn command configuration
+  # Gunicorn command configuration: gunicorn.conf.py (baked into the image)
+  # provides the threaded worker class, node-sized worker count and 75s
+  # keepalive; Terraform-managed values are layered on top via CLI flags
+  # (which take precedence) and the GUNICORN_WORKERS environment variable
   gunicorn_command = [
     "gunicorn",
+    "-c", "gunicorn.conf.py",
     "--bind", "0.0.0.0:${var.app_port}",
-    "--workers", tostring(var.gunicorn_workers),
     "--timeout", tostring(var.gunicorn_timeout),
-    "--worker-class", "sync",
     "--max-requests", "1000",
     "--max-requests-jitter", "100",
     "--preload",
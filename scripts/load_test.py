@@ -6,60 +6,109 @@ node distribution.
 """
 
 import argparse
+import asyncio
+import math
 import sys
+import time
 from collections import Counter
 
-import requests
-import urllib3
+import aiohttp
 
-# Disable SSL warnings for self-signed certificates
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Upper bound on in-flight requests so the client does not overwhelm itself
+DEFAULT_CONCURRENCY = 100
 
+DEFAULT_BASE_URL = "https://localhost:8080"
+ENDPOINT_PATHS = {"ping": "/api/ping", "health": "/health"}
 
-def make_request(url, timeout=10):
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile (nearest-rank) of a pre-sorted list."""
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+async def make_request(session, url, timeout=10):
     """Make a single request to the ping endpoint."""
     try:
-        response = requests.get(url, verify=False, timeout=timeout)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("hostname", "unknown"), True
-        else:
-            return "error", False
+        async with session.get(
+            url, ssl=False, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return data.get("hostname", "unknown"), True
+            else:
+                return "error", False
     except Exception:
         return "error", False
 
 
-def run_load_test(url, num_requests, timeout=10):
+async def run_load_test(
+    url, num_requests, timeout=10, concurrency=DEFAULT_CONCURRENCY, rps=None
+):
     """Run load test and collect results."""
     print("🚀 Starting load test...")
     print(f"Target URL: {url}")
     print(f"Total Requests: {num_requests}")
+    print(f"Concurrency: {concurrency}")
     print("-" * 50)
 
-    hostnames = []
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+
+    # Cap progress output at ~20 lines per run; per-request prints would
+    # serialize the loop once pooled requests drop below stdout latency
+    progress_every = max(1, num_requests // 20)
+
+    # Tally per-node counts as requests complete instead of accumulating raw
+    # hostnames: memory stays O(unique nodes) regardless of request count
+    hostname_counter = Counter()
     successful_requests = 0
     failed_requests = 0
+    latencies = []
 
-    for i in range(num_requests):
-        # Progress indicator
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"Progress: {i + 1}/{num_requests} requests...")
-
-        hostname, success = make_request(url, timeout)
+    async def bounded_request(session):
+        nonlocal completed, successful_requests, failed_requests
+        async with semaphore:
+            start = time.perf_counter()
+            hostname, success = await make_request(session, url, timeout)
+            latencies.append(time.perf_counter() - start)
 
         if success:
-            hostnames.append(hostname)
+            hostname_counter[hostname] += 1
             successful_requests += 1
         else:
             failed_requests += 1
 
+        # Progress indicator
+        completed += 1
+        if completed % progress_every == 0 or completed == num_requests:
+            print(f"Progress: {completed}/{num_requests} requests...")
+
+    # Cache the getaddrinfo result for the whole run so new connections do
+    # not go back through the resolver for every handshake
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = []
+        for _ in range(num_requests):
+            tasks.append(asyncio.create_task(bounded_request(session)))
+            # Paced dispatch: spread task submission to hold the target rate
+            if rps:
+                await asyncio.sleep(1 / rps)
+        await asyncio.gather(*tasks)
+
     print("✅ Load test completed!")
     print("-" * 50)
 
-    return hostnames, successful_requests, failed_requests
+    return hostname_counter, successful_requests, failed_requests, latencies
 
 
-def analyze_results(hostnames, successful_requests, failed_requests):
+def analyze_results(
+    hostname_counter,
+    successful_requests,
+    failed_requests,
+    latencies,
+    analyze_nodes=True,
+):
     """Analyze results and print Alcatraz AI required information."""
     print("\n" + "=" * 60)
     print("         ALCATRAZ AI LOAD TEST RESULTS")
@@ -77,10 +126,18 @@ def analyze_results(hostnames, successful_requests, failed_requests):
     print(f"Success Rate: {success_rate:.1f}%")
     print()
 
-    if successful_requests > 0:
-        # Count requests per node
-        hostname_counter = Counter(hostnames)
+    if latencies:
+        sorted_latencies = sorted(latencies)
+        print("⏱️  LATENCY PERCENTILES:")
+        print("-" * 40)
+        for pct in (50, 95, 99):
+            print(f"  p{pct}: {percentile(sorted_latencies, pct) * 1000:.1f} ms")
+        print()
 
+    if not analyze_nodes:
+        return
+
+    if successful_requests > 0:
         # 🎯 ALCATRAZ AI REQUIREMENT 1: List of node hostnames
         print("📋 LIST OF NODE HOSTNAMES:")
         print("-" * 40)
@@ -120,8 +177,15 @@ def main():
     )
     parser.add_argument(
         "--url",
-        default="https://localhost:8080/api/ping",
-        help="Target URL (default: https://localhost:8080/api/ping)",
+        default=None,
+        help=f"Target URL (default: {DEFAULT_BASE_URL} + endpoint path)",
+    )
+    parser.add_argument(
+        "--endpoint",
+        "-e",
+        choices=sorted(ENDPOINT_PATHS),
+        default="ping",
+        help="Endpoint to test; health skips node analysis (default: ping)",
     )
     parser.add_argument(
         "--requests",
@@ -137,6 +201,19 @@ def main():
         default=10,
         help="Request timeout in seconds (default: 10)",
     )
+    parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum in-flight requests (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=None,
+        help="Target request submission rate per second (default: unpaced)",
+    )
 
     args = parser.parse_args()
 
@@ -145,14 +222,26 @@ def main():
         print("❌ Error: Number of requests must be positive")
         sys.exit(1)
 
+    if args.concurrency <= 0:
+        print("❌ Error: Concurrency must be positive")
+        sys.exit(1)
+
+    url = args.url or DEFAULT_BASE_URL + ENDPOINT_PATHS[args.endpoint]
+
     try:
         # Run load test
-        hostnames, successful, failed = run_load_test(
-            args.url, args.requests, args.timeout
+        hostname_counter, successful, failed, latencies = asyncio.run(
+            run_load_test(url, args.requests, args.timeout, args.concurrency, args.rps)
         )
 
-        # Analyze and display results
-        analyze_results(hostnames, successful, failed)
+        # Analyze and display results; /health responses carry no hostname
+        analyze_results(
+            hostname_counter,
+            successful,
+            failed,
+            latencies,
+            analyze_nodes=args.endpoint == "ping",
+        )
 
     except KeyboardInterrupt:
         print("\n❌ Load test interrupted by user")
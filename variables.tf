@@ -68,13 +68,13 @@ variable "container_memory_swap" {
 }
 
 variable "gunicorn_workers" {
-  description = "Number of Gunicorn worker processes per container"
+  description = "Number of Gunicorn worker processes per container (0 = auto-size to the node)"
   type        = number
-  default     = 2
+  default     = 0
 
   validation {
-    condition     = var.gunicorn_workers >= 1 && var.gunicorn_workers <= 8
-    error_message = "Gunicorn workers must be between 1 and 8."
+    condition     = var.gunicorn_workers >= 0 && var.gunicorn_workers <= 8
+    error_message = "Gunicorn workers must be between 0 (auto) and 8."
   }
 }
 
@@ -196,7 +196,7 @@ variable "docker_build_no_cache" {
 variable "rebuild_trigger_files" {
   description = "List of files that should trigger Docker image rebuilds"
   type        = list(string)
-  default     = ["Dockerfile", "app.py", "requirements.txt"]
+  default     = ["Dockerfile", "app.py", "requirements.txt", "gunicorn.conf.py"]
 
   validation {
     condition     = length(var.rebuild_trigger_files) > 0